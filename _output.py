@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import os
 import sys
+from collections.abc import Iterable, Sequence
 
 # Respect NO_COLOR convention (https://no-color.org/)
 _NO_COLOR = os.environ.get("NO_COLOR") is not None or not sys.stdout.isatty()
@@ -86,6 +87,11 @@ def fail(msg: str) -> None:
     print(f"  {_RED}{_BOLD}FAIL{_RESET} {msg}")
 
 
+def detected(expected_ids: Iterable[str], actual_ids: Iterable[str]) -> bool:
+    """Return True if every expected rule ID appears in actual_ids."""
+    return set(expected_ids).issubset(actual_ids)
+
+
 def summary_header() -> None:
     """Print the run_all summary header."""
     print()
@@ -100,11 +106,11 @@ def summary_line(
     index: int,
     total: int,
     name: str,
-    expected_ids: list[str],
-    actual_ids: list[str],
+    expected_ids: Sequence[str],
+    actual_ids: Sequence[str],
 ) -> bool:
     """Print one line of the summary table. Returns True if passed."""
-    matched = all(eid in actual_ids for eid in expected_ids)
+    matched = detected(expected_ids, actual_ids)
     ids_str = ", ".join(actual_ids) if actual_ids else "none"
 
     dots = "." * (48 - len(f"[{index}/{total}] {name}"))
@@ -11,14 +11,20 @@ from __future__ import annotations
 
 import sys
 import os
+from operator import itemgetter
 
-sys.path.insert(0, os.path.dirname(__file__))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from _output import banner, scenario, step, results, explainer
+from _output import banner, scenario, step, results, explainer, detected
 
 from aktov import Aktov
 
 
+EXPECTED: tuple[str, ...] = ("AK-007",)
+
+
 def run() -> dict:
     """Run the demo and return {rule_ids, response}."""
 
@@ -62,15 +68,16 @@ def run() -> dict:
         "Works the same way regardless of framework."
     )
 
-    rule_ids = [a["rule_id"] for a in response.alerts]
+    rule_ids = list(map(itemgetter("rule_id"), response.alerts))
     return {"rule_ids": rule_ids, "response": response}
 
 
 if __name__ == "__main__":
     result = run()
     rule_ids = result["rule_ids"]
-    if "AK-007" in rule_ids:
-        print("  Demo passed: AK-007 detected.")
+    expected = " + ".join(EXPECTED)
+    if detected(EXPECTED, rule_ids):
+        print(f"  Demo passed: {expected} detected.")
     else:
-        print(f"  Demo FAILED: expected AK-007, got {rule_ids}", file=sys.stderr)
+        print(f"  Demo FAILED: expected {expected}, got {rule_ids}", file=sys.stderr)
         sys.exit(1)
@@ -11,14 +11,20 @@ from __future__ import annotations
 
 import sys
 import os
+from operator import itemgetter
 
-sys.path.insert(0, os.path.dirname(__file__))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from _output import banner, scenario, step, results, explainer
+from _output import banner, scenario, step, results, explainer, detected
 
 from aktov import Aktov
 
 
+EXPECTED: tuple[str, ...] = ("CUSTOM-001",)
+
+
 def run() -> dict:
     """Run the demo and return {rule_ids, response}."""
 
@@ -33,7 +39,7 @@ def run() -> dict:
     )
 
     # ── Set up Aktov with custom rules directory ──
-    rules_dir = os.path.join(os.path.dirname(__file__), "rules")
+    rules_dir = os.path.join(_HERE, "rules")
     ak = Aktov(agent_id="etl-pipeline", agent_type="custom", rules_dir=rules_dir)
     trace = ak.start_trace()
 
@@ -71,15 +77,16 @@ def run() -> dict:
         "min_count: 3. See rules/custom_high_write_count.yaml for the rule definition."
     )
 
-    rule_ids = [a["rule_id"] for a in response.alerts]
+    rule_ids = list(map(itemgetter("rule_id"), response.alerts))
     return {"rule_ids": rule_ids, "response": response}
 
 
 if __name__ == "__main__":
     result = run()
     rule_ids = result["rule_ids"]
-    if "CUSTOM-001" in rule_ids:
-        print("  Demo passed: CUSTOM-001 detected.")
+    expected = " + ".join(EXPECTED)
+    if detected(EXPECTED, rule_ids):
+        print(f"  Demo passed: {expected} detected.")
     else:
-        print(f"  Demo FAILED: expected CUSTOM-001, got {rule_ids}", file=sys.stderr)
+        print(f"  Demo FAILED: expected {expected}, got {rule_ids}", file=sys.stderr)
         sys.exit(1)
